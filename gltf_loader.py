@@ -5,8 +5,9 @@ import pygltflib
 
 
 Model = namedtuple('Model', 'name nodes ordered_node_indexes meshes animations skins')
-Mesh = namedtuple('Mesh', 'name primitives')
-Primitive = namedtuple('Primitive', 'name material triangles vertices normals uvs joints weights')
+Mesh = namedtuple('Mesh', 'name primitives weights')
+Primitive = namedtuple('Primitive', 'name material triangles vertices normals uvs joints weights targets')
+MorphTarget = namedtuple('MorphTarget', 'indices deltas')
 AnimationSampler = namedtuple('AnimationSampler', 'interpolation keyframe_times keyframe_values')
 AnimationChannel = namedtuple('AnimationChannel', 'sampler node path')
 Animation = namedtuple('Animation', 'samplers channels, duration')
@@ -53,6 +54,44 @@ def load_accessor_data(gltf, accessor):
     return elements
 
 
+def load_sparse_accessor_data(gltf, accessor):
+    '''
+        Returns only the non-zero elements of an accessor as (indices, values), whether the accessor is stored dense,
+        sparse, or as a sparse override on top of a dense buffer.
+    '''
+    dtype, cnt = get_dtype_cnt(accessor)
+    if accessor.bufferView is not None:
+        elements = load_accessor_data(gltf, accessor)[:accessor.count]
+    else:
+        elements = np.zeros((accessor.count, cnt), dtype=dtype)
+    if accessor.sparse:
+        sparse = accessor.sparse
+        index_accessor = pygltflib.Accessor(bufferView=sparse.indices.bufferView, componentType=sparse.indices.componentType, type='SCALAR')
+        value_accessor = pygltflib.Accessor(bufferView=sparse.values.bufferView, componentType=accessor.componentType, type=accessor.type)
+        sparse_indices = load_accessor_data(gltf, index_accessor)[:sparse.count]
+        sparse_values = load_accessor_data(gltf, value_accessor)[:sparse.count]
+        elements = np.array(elements)
+        elements[sparse_indices] = sparse_values
+    indices = np.flatnonzero(np.any(elements != 0, axis=1)).astype(np.uint32)
+    return indices, np.ascontiguousarray(elements[indices])
+
+
+def load_morph_targets(gltf, primitive):
+    '''
+        Loads each morph target as a sparse delta set; only the vertices a target actually moves are kept.
+    '''
+    targets = []
+    for target in primitive.targets or []:
+        position = target.get('POSITION') if isinstance(target, dict) else getattr(target, 'POSITION', None)
+        if position is None:
+            targets.append(MorphTarget(np.empty(0, dtype=np.uint32), np.empty((0, 3), dtype=np.float32)))
+            continue
+        indices, deltas = load_sparse_accessor_data(gltf, gltf.accessors[position])
+        assert deltas.dtype == np.float32
+        targets.append(MorphTarget(indices, deltas))
+    return targets
+
+
 def load_model(fname):
     gltf = pygltflib.GLTF2().load(fname)
 
@@ -78,8 +117,14 @@ def load_model(fname):
                 assert len(vertices) == len(joints) == len(weights)
                 joints = np.array(joints, dtype=np.uint16)
             assert np.max(triangles) == len(vertices) - 1
-            primitives.append(Primitive(mesh.name, primitive.material, triangles, vertices, normals, uvs, joints, weights))
-        meshes.append(Mesh(mesh.name, primitives))
+            targets = load_morph_targets(gltf, primitive)
+            assert all(len(target.indices) == 0 or target.indices[-1] < len(vertices) for target in targets)
+            primitives.append(Primitive(mesh.name, primitive.material, triangles, vertices, normals, uvs, joints, weights, targets))
+        num_targets = max([len(p.targets) for p in primitives], default=0)
+        mesh_weights = np.zeros(num_targets, dtype=np.float32)
+        if mesh.weights:
+            mesh_weights[:len(mesh.weights)] = mesh.weights
+        meshes.append(Mesh(mesh.name, primitives, mesh_weights))
 
     animations = []
     for anim in gltf.animations:
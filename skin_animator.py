@@ -16,7 +16,11 @@ class SkinAnimator:
         self.skinned_primitives = []
         self.homogenized_vertices = [] # input for skinning
         self.skinned_vertices = [] # output for skinning
+        self.morphed_vertices = [] # morph target output, input for skinning
+        self.morph_targets = [] # concatenated sparse (indices, deltas, offsets) per primitive
+        self.mesh_nodes = {node.mesh: node for node in model.nodes if node.mesh is not None}
         self.init_opt_skin_vertices()
+        self.init_opt_morph_targets()
 
     def init_opt_skin_vertices(self):
         for mesh in self.model.meshes:
@@ -27,6 +31,23 @@ class SkinAnimator:
                 self.homogenized_vertices.append(hvertices)
                 self.skinned_vertices.append(hvertices.copy())
 
+    def init_opt_morph_targets(self):
+        '''
+            Concatenate all sparse targets of each primitive, so that the active ones can be accumulated in a single pass.
+        '''
+        for mesh in self.model.meshes:
+            for primitive in mesh.primitives:
+                targets = primitive.targets
+                if not targets:
+                    self.morphed_vertices.append(None)
+                    self.morph_targets.append(None)
+                    continue
+                indices = np.concatenate([target.indices for target in targets]).astype(np.int64)
+                deltas = np.concatenate([target.deltas for target in targets]).astype(np.float32)
+                offsets = np.cumsum([0] + [len(target.indices) for target in targets]).astype(np.int64)
+                self.morphed_vertices.append(self.homogenized_vertices[len(self.morphed_vertices)].copy())
+                self.morph_targets.append((indices, deltas, offsets))
+
     def start_animate(self, mode='loop', speed=1.0, animation_index=0):
         self.mode = mode
         self.speed = speed
@@ -58,9 +79,10 @@ class SkinAnimator:
         add_primitives = True if not self.skinned_primitives else False
         joint_matrices = self.calc_joint_matrices()
         primitive_index = 0
-        for mesh in self.model.meshes:
+        for mesh_index, mesh in enumerate(self.model.meshes):
+            morph_weights = self.get_morph_weights(mesh_index)
             for primitive in mesh.primitives:
-                homogenized_vertices = self.homogenized_vertices[primitive_index]
+                homogenized_vertices = self.morph_vertices(primitive_index, morph_weights)
                 skinned_vertex_buf = self.skinned_vertices[primitive_index]
                 primitive_index += 1
                 apply_skinning_to_vertices(homogenized_vertices, skinned_vertex_buf, primitive.joints, primitive.weights, joint_matrices)
@@ -68,7 +90,36 @@ class SkinAnimator:
                     # drop the homogenized column
                     skinned_vertices = np.lib.stride_tricks.as_strided(skinned_vertex_buf, shape=(len(skinned_vertex_buf), 3), strides=(4*4, 4))
                     # create a new primitive using the skinned vertices
-                    self.skinned_primitives.append(Primitive(primitive.name, primitive.material, primitive.triangles, skinned_vertices, primitive.normals, primitive.uvs, None, None))
+                    self.skinned_primitives.append(Primitive(primitive.name, primitive.material, primitive.triangles, skinned_vertices, primitive.normals, primitive.uvs, None, None, None))
+
+    def get_morph_weights(self, mesh_index):
+        '''
+            Animated weights live on the node instancing the mesh; fall back to the mesh's default weights.
+        '''
+        node = self.mesh_nodes.get(mesh_index)
+        weights = getattr(node, 'weights', None)
+        if weights is None or len(weights) == 0:
+            return self.model.meshes[mesh_index].weights
+        return np.asarray(weights, dtype=np.float32)
+
+    def morph_vertices(self, primitive_index, morph_weights):
+        '''
+            Returns the homogenized vertices with all active morph targets applied. Targets with zero weight are skipped,
+            and when none are active the unmorphed vertices are returned as-is.
+        '''
+        homogenized_vertices = self.homogenized_vertices[primitive_index]
+        morph_targets = self.morph_targets[primitive_index]
+        if morph_targets is None:
+            return homogenized_vertices
+        indices, deltas, offsets = morph_targets
+        num_targets = len(offsets) - 1
+        active_targets = np.flatnonzero(morph_weights[:num_targets])
+        if len(active_targets) == 0:
+            return homogenized_vertices
+        morphed_vertex_buf = self.morphed_vertices[primitive_index]
+        morphed_vertex_buf[:] = homogenized_vertices
+        apply_morph_targets(morphed_vertex_buf, indices, deltas, offsets, active_targets, morph_weights)
+        return morphed_vertex_buf
 
     def animate_nodes(self):
         '''
@@ -90,6 +141,8 @@ class SkinAnimator:
                 self.model.nodes[channel.node].rotation = interpolated_value
             elif channel.path == 'scale':
                 self.model.nodes[channel.node].scale = interpolated_value
+            elif channel.path == 'weights':
+                self.model.nodes[channel.node].weights = interpolated_value
 
     def calc_node_transforms(self):
         '''
@@ -123,6 +176,19 @@ class SkinAnimator:
         return []
 
 
+@njit
+def apply_morph_targets(out_vertex_buf, indices, deltas, offsets, active_targets, morph_weights):
+    # only walk the sparse deltas of the active targets
+    for target_index in active_targets:
+        weight = morph_weights[target_index]
+        for i in range(offsets[target_index], offsets[target_index+1]):
+            vertex = out_vertex_buf[indices[i]]
+            delta = deltas[i]
+            vertex[0] += delta[0] * weight
+            vertex[1] += delta[1] * weight
+            vertex[2] += delta[2] * weight
+
+
 @njit
 def apply_skinning_to_vertices(vertices, out_vertex_buf, joint_indices, vertex_weights, joint_matrices):
     # For each vertex, apply skinning
@@ -164,6 +230,8 @@ def calc_local_transform(node):
 
 def interp_anim_vec(path, t, interpolation, keyframe_times, keyframe_values):
     a,b,t = get_lerp(t, keyframe_times)
+    if path == 'weights':
+        return interp_anim_weights(a, b, t, interpolation, keyframe_times, keyframe_values)
     a = glm.quat(keyframe_values[a, [3,0,1,2]]) if path == 'rotation' else glm.vec3(keyframe_values[a])
     b = glm.quat(keyframe_values[b, [3,0,1,2]]) if path == 'rotation' else glm.vec3(keyframe_values[b])
     if interpolation == 'STEP':
@@ -176,6 +244,16 @@ def interp_anim_vec(path, t, interpolation, keyframe_times, keyframe_values):
     assert False, 'bad interpolation'
 
 
+def interp_anim_weights(a, b, t, interpolation, keyframe_times, keyframe_values):
+    # morph weight samplers output one scalar per target per keyframe
+    keyframe_values = keyframe_values.reshape((len(keyframe_times), -1))
+    if interpolation == 'STEP':
+        return keyframe_values[a]
+    elif interpolation == 'LINEAR':
+        return keyframe_values[a] * (1 - t) + keyframe_values[b] * t
+    assert False, 'bad interpolation'
+
+
 def get_lerp(t, keyframe_times):
     for i, (t0, t1) in enumerate(zip(np.append([0.0], keyframe_times[:-1]), keyframe_times)):
         if t0 <= t < t1: